@@ -3,13 +3,13 @@ import calendar
 import datetime
 import os
 import pathlib
-import pickle
 import re
 import typing
 
 import aiofiles
 import aiohttp
-from bs4 import BeautifulSoup
+import lxml.html
+import msgpack
 from urllib.parse import urljoin
 
 from eaip.airfield import Airfield
@@ -25,8 +25,80 @@ CACHE_DIRECTORY = os.path.join(pathlib.Path.home(), '.cache', 'eaip-lib')
 The directory where file-system cache is stored.
 """
 
+_RE_MENU_ICAO = re.compile(r'(EG\w+)plus')
+_RE_HEADING_ID = re.compile(r'EG\w{2}-AD-\d+.\d')
+_RE_TITLE = re.compile(r'.+AD\s(\d+.\d+)\s+(.+)')
+_RE_WS = re.compile(r'\n\s+')
 
-async def __get_current_version() -> typing.Union[None, datetime.datetime]:
+_RAW_SECTIONS = frozenset({'2.1'})
+"""
+Sections whose full raw text is kept on the data dict. Only 2.1 is
+ever read back (for ICAO and name); dropping the rest keeps multi-KB
+section bodies out of the cache files.
+"""
+
+_session: typing.Optional[aiohttp.ClientSession] = None
+_session_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+_sem: typing.Optional[asyncio.Semaphore] = None
+_sem_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """
+    Returns the fetch semaphore for the running event loop.
+
+    It bounds concurrent HTTP fetches so version probing and airfield
+    fan-out do not saturate the connector or trip server throttling.
+    asyncio primitives bind to the loop that first awaits them, so the
+    semaphore is created lazily and remade whenever the loop changes.
+
+    :return: The fetch semaphore.
+    """
+    global _sem, _sem_loop
+    loop = asyncio.get_running_loop()
+    if _sem is None or _sem_loop is not loop:
+        _sem = asyncio.Semaphore(8)
+        _sem_loop = loop
+    return _sem
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared HTTP session, creating it lazily.
+
+    A single pooled session keeps connections to the eAIP host alive
+    across calls instead of paying DNS/TCP/TLS setup per request.
+
+    The session is bound to the event loop that created it, so a fresh
+    one is made whenever the running loop changes (e.g. successive
+    ``asyncio.run`` calls).
+
+    :return: The shared client session.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16))
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """
+    Closes the shared HTTP session if one has been created.
+
+    Call this on shutdown to release pooled connections cleanly.
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed \
+            and _session_loop is asyncio.get_running_loop():
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def __probe_current_version() -> typing.Union[None, datetime.datetime]:
     """
     Attempts to discover the date for latest release of the eAIP.
 
@@ -38,24 +110,73 @@ async def __get_current_version() -> typing.Union[None, datetime.datetime]:
     year, month = datetime.datetime.now().year, datetime.datetime.now().month
     _, month_len = calendar.monthrange(year, month)
 
-    async with aiohttp.ClientSession() as session:
-        reqs = []
-        for day in range(1, month_len + 1):
-            day_of_month = datetime.datetime(year, month, day)
-            eaip_date = day_of_month.strftime('%Y-%m-%d')
-            url_format = EAIP_INDEX_URL.format(eaip_date)
+    session = await _get_session()
+
+    async def does_eaip_exist(d):
+        url = EAIP_INDEX_URL.format(d.strftime('%Y-%m-%d'))
+        async with _get_semaphore():
+            async with session.head(url) as resp:
+                return d if resp.status == 200 else None
+
+    pending = {asyncio.ensure_future(does_eaip_exist(datetime.datetime(year, month, day)))
+               for day in range(1, month_len + 1)}
+    done = set()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result is not None:
+                    return result
+    finally:
+        for task in pending:
+            task.cancel()
+        # Await the cancellations so no probe outlives this call, and
+        # consume the last done batch so probes that completed alongside
+        # the winning day do not log never-retrieved exceptions.
+        await asyncio.gather(*pending, *done, return_exceptions=True)
+
+
+_current_version: typing.Optional[datetime.datetime] = None
+_current_version_lock: typing.Optional[asyncio.Lock] = None
+_current_version_lock_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_current_version_lock() -> asyncio.Lock:
+    """
+    Returns the version-probe lock for the running event loop.
+
+    Like the fetch semaphore, the lock is remade whenever the running
+    loop changes; the cached version itself stays process-global.
+
+    :return: The version-probe lock.
+    """
+    global _current_version_lock, _current_version_lock_loop
+    loop = asyncio.get_running_loop()
+    if _current_version_lock is None or _current_version_lock_loop is not loop:
+        _current_version_lock = asyncio.Lock()
+        _current_version_lock_loop = loop
+    return _current_version_lock
+
+
+async def __get_current_version() -> typing.Union[None, datetime.datetime]:
+    """
+    Returns the date for the latest release of the eAIP.
+
+    The date is discovered once per process; the "current" release does
+    not change within a run, so subsequent calls are served from an
+    in-process cache without probing the eAIP again.
 
-            async def does_eaip_exist(d, url):
-                async with session.get(url) as resp:
-                    return d if resp.status == 200 else None
-            reqs.append(asyncio.Task(does_eaip_exist(day_of_month, url_format)))
+    :return: Date of latest release.
+    """
+    global _current_version
+    if _current_version is not None:
+        return _current_version
 
-        for result_awaitable in asyncio.as_completed(reqs):
-            result = await result_awaitable
-            if result is not None:
-                for req in reqs:
-                    req.cancel()
-                return result
+    async with _get_current_version_lock():
+        if _current_version is None:
+            _current_version = await __probe_current_version()
+        return _current_version
 
 
 async def __get_airfields_awaitable(eaip_date: datetime.datetime,
@@ -101,20 +222,20 @@ async def get_airfields_icao(eaip_date: datetime.datetime = None) -> typing.List
     :return: List of ICAO codes for airfields.
     """
     if eaip_date is None:
-        eaip_date = __get_current_version()
+        eaip_date = await __get_current_version()
 
     formatted_date = get_formatted_date(eaip_date)
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(EAIP_MENU_URL.format(formatted_date)) as resp:
-            menu_content = await resp.text()
-            soup = BeautifulSoup(menu_content, 'html.parser')
-            menu_element = soup.find(id='AD-2details')
-            menu_item_elements = menu_element.find_all('div', 'Hx', recursive=False)
+    session = await _get_session()
+    async with session.get(EAIP_MENU_URL.format(formatted_date)) as resp:
+        menu_content = await resp.text()
+        menu_tree = lxml.html.fromstring(menu_content)
+        menu_item_ids = menu_tree.xpath(
+            '//*[@id="AD-2details"]/div[contains(@class, "Hx")]/*[1]/@id')
 
-            icao_list = [re.findall(r'.*(EG\w+)plus', next(menu_item.children).attrs['id'])[0]
-                         for menu_item in menu_item_elements]
-            return icao_list
+        icao_list = [_RE_MENU_ICAO.search(menu_item_id)[1]
+                     for menu_item_id in menu_item_ids]
+        return icao_list
 
 
 def get_airfield_from_raw_html(html: str, eaip_date: datetime.datetime = None) -> Airfield:
@@ -126,19 +247,34 @@ def get_airfield_from_raw_html(html: str, eaip_date: datetime.datetime = None) -
     :param eaip_date: The date of eAIP release.
     :return: An airfield.
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    airfield_element = soup.find(id=re.compile(r'AD-2\.EG\w{2}'))
+    return __get_airfield_from_tree(lxml.html.fromstring(html), eaip_date)
+
+
+def __get_airfield_from_tree(tree, eaip_date: datetime.datetime) -> Airfield:
+    """
+    Builds an airfield object from a parsed eAIP document tree.
+
+    :param tree: The parsed lxml document tree.
+    :param eaip_date: The date of eAIP release.
+    :return: An airfield.
+    """
+    airfield_element = tree.xpath('//*[starts-with(@id, "AD-2.EG")]')[0]
 
     formatted_date = get_formatted_date(eaip_date)
 
     # Filter out junk that is irrelevant to API
-    for div in airfield_element.find_all('span', {'class': ['sdParams', 'sdTooltip', 'AmdtDeletedAIRAC']}):
-        div.decompose()
+    for span in airfield_element.xpath(
+            './/span[contains(@class, "sdParams") or contains(@class, "sdTooltip")'
+            ' or contains(@class, "AmdtDeletedAIRAC")]'):
+        span.drop_tree()
 
     airfield_raw_data = {}
-    for item in airfield_element.find_all(id=re.compile(r'EG\w{2}-AD-\d+.\d'), recursive=False):
-        title = item.find_all('h4', 'Title')[0]
-        heading_number, heading = re.findall(r'.+AD\s(\d+.\d+)\s+(.+)', title.text)[0]
+    for item in airfield_element.xpath('./*[@id]'):
+        if not _RE_HEADING_ID.search(item.get('id')):
+            continue
+
+        title = item.xpath('.//h4[contains(@class, "Title")]')[0]
+        heading_number, heading = _RE_TITLE.findall(''.join(title.itertext()))[0]
 
         airfield_datapoint_entry = {
             'heading_number': heading_number,
@@ -146,19 +282,20 @@ def get_airfield_from_raw_html(html: str, eaip_date: datetime.datetime = None) -
             'data': {}
         }
 
-        table = item.find_all('table', recursive=False)
+        table = item.xpath('./table')
         if table:
-            table_data = [[re.sub(r'\n\s+', '\n', cell.text).strip()
-                           for cell in row('td')] for row in table[0]('tr')]
+            table_data = [[_RE_WS.sub('\n', ''.join(cell.itertext())).strip()
+                           for cell in row.xpath('.//td')]
+                          for row in table[0].xpath('.//tr')]
             airfield_datapoint_entry['data'] = table_data
         else:
             airfield_datapoint_entry['data'] = None
 
-        airfield_datapoint_entry['raw'] = item.text
+        airfield_datapoint_entry['raw'] = \
+            ''.join(item.itertext()) if heading_number in _RAW_SECTIONS else None
         airfield_datapoint_entry['links'] = [urljoin(EAIP_MENU_URL.format(formatted_date), link.get('href'))
-                                             for link in item.find_all('a', attrs={'href': True})]
+                                             for link in item.xpath('.//a[@href]')]
         airfield_raw_data[heading_number] = airfield_datapoint_entry
-        airfield_raw_data[heading] = airfield_datapoint_entry
 
     return Airfield(airfield_raw_data)
 
@@ -193,23 +330,31 @@ async def get_airfield(airfield_icao: str = None, eaip_date: datetime.datetime =
     formatted_date = get_formatted_date(eaip_date)
 
     cache_dir = os.path.join(CACHE_DIRECTORY, formatted_date)
-    cache_url = os.path.join(cache_dir, f'{airfield_icao}.bin')
+    # The .msgpack suffix namespaces the current serialization format;
+    # caches written by the old pickle format miss instead of decoding
+    # to garbage.
+    cache_url = os.path.join(cache_dir, f'{airfield_icao}.msgpack')
 
     if not os.path.isdir(cache_dir):
         os.makedirs(cache_dir, exist_ok=True)
 
     if not bypass_cache:
         if os.path.exists(cache_url):
-            with open(cache_url, 'rb') as cache:
-                return pickle.loads(cache.read())
+            async with aiofiles.open(cache_url, 'rb') as cache:
+                return Airfield(await cache.read())
 
-    async with aiohttp.ClientSession() as session:
+    session = await _get_session()
+    async with _get_semaphore():
         async with session.get(EAIP_AIRFIELD_URL.format(formatted_date, airfield_icao)) as resp:
-            airfield_content = await resp.text()
-            a = get_airfield_from_raw_html(airfield_content, eaip_date)
+            # Feed the body into the parser as it arrives so parsing
+            # overlaps the download instead of buffering the full page.
+            parser = lxml.html.HTMLParser()
+            async for chunk in resp.content.iter_chunked(32 * 1024):
+                parser.feed(chunk)
+            a = __get_airfield_from_tree(parser.close(), eaip_date)
 
             async with aiofiles.open(cache_url, 'wb') as cache:
-                await cache.write(pickle.dumps(a))
+                await cache.write(msgpack.packb(a.data, use_bin_type=True))
             return a
 
 
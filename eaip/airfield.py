@@ -2,12 +2,20 @@ import re
 import typing
 from functools import cached_property
 
-from geopy.point import Point
+import msgpack
 
 from eaip.hours import OperatingHours, get_operating_hours_from_string
 from eaip.radio import RadioFrequency
 from eaip.runway import Runway
 from eaip.airspace import Airspace
+from eaip.airspace._geo import dms_to_decimal
+
+_RE_NAME = re.compile(r'—\s+([\w /]+)')
+_RE_LAT = re.compile(r'Lat: (\d{2})(\d{2})(\d{2})([NS])')
+_RE_LONG = re.compile(r'Long: (\d{3})(\d{2})(\d{2})([EW])')
+_RE_PHONE = re.compile(r'([\d\- ]+\d)(?: Ext (\d+))?(?: \((.+)\))?')
+_RE_EMAIL = re.compile(r'(\S+@\S+)(?: \((.+)\))?')
+_RE_NON_DIGIT = re.compile(r'\D')
 
 
 class Airfield:
@@ -39,8 +47,53 @@ class Airfield:
     radios_by_designation: typing.Dict[str, typing.List[RadioFrequency]]
     ppr: bool
 
-    def __init__(self, data: dict):
-        self.data = data
+    def __init__(self, data: typing.Union[dict, bytes]):
+        if isinstance(data, (bytes, bytearray)):
+            self._raw_data = data
+            self._data = None
+        else:
+            self._raw_data = None
+            self._data = data
+
+    @property
+    def data(self) -> dict:
+        """
+        Raw scraped data keyed by section heading.
+
+        When loaded from the file-system cache the msgpack payload is
+        decoded lazily on first access, so cache hits that only read a
+        couple of attributes do not pay for the full decode up front.
+
+        :raises ValueError: If the cached payload cannot be decoded.
+        """
+        if self._data is None:
+            try:
+                self._data = msgpack.unpackb(self._raw_data, raw=False)
+            except (msgpack.exceptions.UnpackException,
+                    msgpack.exceptions.ExtraData, ValueError) as error:
+                raise ValueError(
+                    'Cached airfield data could not be decoded; the '
+                    f'file-system cache is stale or corrupt ({error}). '
+                    'Delete the cache entry or fetch with bypass_cache=True.'
+                ) from error
+            self._raw_data = None
+        return self._data
+
+    def get_section(self, key: str) -> typing.Union[None, dict]:
+        """
+        Returns a section entry by heading number (e.g. ``'2.2'``) or
+        by full heading name.
+
+        Sections are stored once, keyed by heading number; heading-name
+        lookups fall back to a scan of the entries.
+
+        :param key: Heading number or heading name.
+        :return: The section entry, or ``None`` if not present.
+        """
+        entry = self.data.get(key)
+        if entry is not None:
+            return entry
+        return next((e for e in self.data.values() if e['heading'] == key), None)
 
     @cached_property
     def icao(self) -> str:
@@ -54,76 +107,78 @@ class Airfield:
         """
         Full name of Airfield.
         """
-        return re.findall(r'—\s+([\w /]+)', self.data['2.1']['raw'])[0].title()
+        return _RE_NAME.findall(self.data['2.1']['raw'])[0].title()
 
     @cached_property
     def geog(self) -> typing.Tuple[float, float]:
         """
         Latitude and longitude of Airfield in decimal.
         """
-        lat_deg, lat_min, lat_sec, lat_dir = re.findall(r'Lat: (\d{2})(\d{2})(\d{2})([NS])',
-                                                        self.data['2.2']['data'][0][2])[0]
-        long_deg, long_min, long_sec, long_dir = re.findall(r'Long: (\d{3})(\d{2})(\d{2})([EW])',
-                                                            self.data['2.2']['data'][0][2])[0]
-        lat = Point.parse_degrees(lat_deg, lat_min, lat_sec, direction=lat_dir)
-        long = Point.parse_degrees(long_deg, long_min, long_sec, direction=long_dir)
+        lat_deg, lat_min, lat_sec, lat_dir = _RE_LAT.findall(self.data['2.2']['data'][0][2])[0]
+        long_deg, long_min, long_sec, long_dir = _RE_LONG.findall(self.data['2.2']['data'][0][2])[0]
+        lat = dms_to_decimal(lat_deg, lat_min, lat_sec, lat_dir)
+        long = dms_to_decimal(long_deg, long_min, long_sec, long_dir)
         return lat, long
 
+    @cached_property
+    def _section_2_2(self) -> typing.Dict[str, str]:
+        """
+        Section 2.2 rows keyed by label, built in a single pass.
+        """
+        return {row[1]: row[2] for row in self.data['2.2']['data']}
+
+    @cached_property
+    def _section_2_3(self) -> typing.Dict[str, str]:
+        """
+        Section 2.3 rows keyed by label, built in a single pass.
+        """
+        return {row[1]: row[2] for row in self.data['2.3']['data']}
+
     @cached_property
     def opening_hours(self) -> typing.Union[None, OperatingHours]:
         """
         Represents the opening hours for this Airfield.
         """
-        for row in self.data['2.3']['data']:
-            if row[1] == 'AD Administration':
-                return get_operating_hours_from_string(row[2])
-        return None
+        hours = self._section_2_3.get('AD Administration')
+        return get_operating_hours_from_string(hours) if hours is not None else None
 
     @cached_property
     def contact_phone(self) -> typing.List[typing.Tuple[str, str, str]]:
         """
         A list of contact phone numbers along with description and extension (if applicable).
         """
-        for row in self.data['2.2']['data']:
-            if row[1] == 'Telephone':
-                contact_phone_raw = re.findall(r'([\d\- ]+\d)(?: Ext (\d+))?(?: \((.+)\))?', row[2])
-                return [(
-                    desc,
-                    ''.join(filter(str.isdigit, number)),
-                    ''.join(filter(str.isdigit, ext)))
-                    for number, ext, desc in contact_phone_raw]
-        return []
+        telephone = self._section_2_2.get('Telephone')
+        if telephone is None:
+            return []
+        return [(
+            desc,
+            _RE_NON_DIGIT.sub('', number),
+            _RE_NON_DIGIT.sub('', ext))
+            for number, ext, desc in _RE_PHONE.findall(telephone)]
 
     @cached_property
     def contact_email(self) -> typing.List[typing.Tuple[str, str]]:
         """
         A list of contact email addresses along with description.
         """
-        for row in self.data['2.2']['data']:
-            if row[1] == 'E-mail address':
-                contact_email_raw = re.findall(r'(\S+@\S+)(?: \((.+)\))?', row[2])
-                return [(desc, email) for email, desc in contact_email_raw]
-        return []
+        email = self._section_2_2.get('E-mail address')
+        if email is None:
+            return []
+        return [(desc, email) for email, desc in _RE_EMAIL.findall(email)]
 
     @cached_property
     def website(self) -> typing.Union[None, str]:
         """
         A website address for the Airfield.
         """
-        for row in self.data['2.2']['data']:
-            if row[1] == 'Web address':
-                return row[2]
-        return None
+        return self._section_2_2.get('Web address')
 
     @cached_property
     def address(self) -> typing.Union[None, str]:
         """
         Address for airfield.
         """
-        for row in self.data['2.2']['data']:
-            if row[1] == 'Address':
-                return row[2]
-        return None
+        return self._section_2_2.get('Address')
 
     @cached_property
     def runways(self) -> typing.List[Runway]:
@@ -143,6 +198,17 @@ class Airfield:
             runways[r.designation] = r
         return runways
 
+    @cached_property
+    def _papi_by_designation(self) -> typing.Dict[str, typing.Union[None, str]]:
+        """
+        Section 2.14 approach lighting keyed by runway designation,
+        built in a single pass.
+        """
+        if self.data['2.14']['data']:
+            return {row[0]: row[3].partition('\n')[0] or None
+                    for row in self.data['2.14']['data'][2:]}
+        return {}
+
     @cached_property
     def radios(self) -> typing.List[RadioFrequency]:
         """
@@ -150,6 +216,22 @@ class Airfield:
         """
         return [radio_fq for designation in self.radios_by_designation.values() for radio_fq in designation]
 
+    @cached_property
+    def _radio_labels(self) -> typing.Dict[int, typing.Tuple[str, str]]:
+        """
+        (designation, callsign) for every section 2.18 row, keyed by row
+        identity. Built in one forward pass carrying the last non-empty
+        values, so RadioFrequency does not re-scan the table per row.
+        """
+        labels = {}
+        designation, callsign = None, None
+        if self.data['2.18']['data']:
+            for row in self.data['2.18']['data'][2:]:
+                designation = row[0] if row[0] else designation
+                callsign = row[1] if row[1] else callsign
+                labels[id(row)] = (designation, callsign)
+        return labels
+
     @cached_property
     def radios_by_designation(self) -> typing.Dict[str, typing.List[RadioFrequency]]:
         """
@@ -191,8 +273,8 @@ class Airfield:
         A list of PDF charts for this airfield stored as tuple (Chart Title, Chart URL).
         """
         if self.data['2.24']['data']:
-            return [(self.data['2.24']['data'][x][0], self.data['2.24']['links'][i])
-                    for i, x in enumerate(range(0, len(self.data['2.24']['data']), 2))]
+            return [(row[0], link)
+                    for row, link in zip(self.data['2.24']['data'][::2], self.data['2.24']['links'])]
         return None
 
     def __repr__(self):
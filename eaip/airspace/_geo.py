@@ -0,0 +1,20 @@
+import typing
+
+
+def dms_to_decimal(degrees: typing.Union[str, int], minutes: typing.Union[str, int],
+                   seconds: typing.Union[str, float], direction: str) -> float:
+    """
+    Converts a degrees/minutes/seconds coordinate to decimal degrees.
+
+    Plain-arithmetic replacement for geopy's ``Point.parse_degrees``,
+    which is pure Python and hot when converting the many vertices of
+    an airspace boundary.
+
+    :param degrees: Whole degrees.
+    :param minutes: Whole minutes.
+    :param seconds: Seconds, possibly fractional.
+    :param direction: Compass direction, one of N/S/E/W.
+    :return: Coordinate in decimal degrees, negative for S/W.
+    """
+    value = int(degrees) + int(minutes) / 60 + float(seconds) / 3600
+    return -value if direction in ('S', 'W') else value
@@ -8,6 +8,51 @@ from eaip.airspace.geog import Geog
 from eaip.airspace.lateral import Arc, Line, Parallel, Circle
 from eaip.airspace.vertical import Altitude, Level
 
+_RE_CIRCLE = re.compile(
+    r'^.+ circle.+(\d+(?:\.\d+)?) NM .+ '
+    r'centred .+(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW])'
+    r'(?: .+ \((\d+)\/(\d+)\))?.*$'
+)
+_RE_LATERAL_LINE = re.compile(
+    r'^(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW])$'
+)
+_RE_LATERAL_ARC = re.compile(
+    r'^(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW]) '
+    r'thence (clockwise|anti-clockwise) '
+    r'.+arc.+ (\d+(?:\.\d+)?) NM '
+    r'centred on '
+    r'(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW]) to '
+    r'(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW])$'
+)
+_RE_LATERAL_PARALLEL = re.compile(
+    r'^(\d{2})(\d{2})(\d{2})([NS]) '
+    r'(\d{3})(\d{2})(\d{2})([EW])'
+    r'.+line of latitude.+$'
+)
+
+_LATERAL_PATTERNS = (
+    (Line, _RE_LATERAL_LINE),
+    (Arc, _RE_LATERAL_ARC),
+    (Parallel, _RE_LATERAL_PARALLEL)
+)
+
+_RE_VERTICAL_ALTITUDE = re.compile(r'^(\d+) FT (ALT|AGL)$')
+_RE_VERTICAL_LEVEL = re.compile(r'^(?:(SFC|FL)(\d+)?)$')
+
+_VERTICAL_PATTERNS = (
+    (Altitude, _RE_VERTICAL_ALTITUDE),
+    (Level, _RE_VERTICAL_LEVEL)
+)
+
+_RE_UPPER_LIMIT = re.compile(r'Upper limit: (.+)')
+_RE_LOWER_LIMIT = re.compile(r'Lower limit: (.+)')
+_RE_TRANSITION_ALT = re.compile(r'(\d+) FT')
+
 class Airspace:
     """
     Object that represents airspace including
@@ -55,13 +100,7 @@ class Airspace:
         airspace (Or None if not applicable).
         """
         descriptor = self.data[0].split('\n', 1)[1]
-        match = re.search(
-            r'^.+ circle.+(\d+(?:\.\d+)?) NM .+ '
-            r'centred .+(\d{2})(\d{2})(\d{2})([NS]) '
-            r'(\d{3})(\d{2})(\d{2})([EW])'
-            r'(?: .+ \((\d+)\/(\d+)\))?.*$',
-            descriptor
-        )
+        match = _RE_CIRCLE.search(descriptor)
         return Circle(match, self) if match is not None else None
 
     @cached_property
@@ -71,38 +110,24 @@ class Airspace:
         airspace (Empty if not applicable).
         """
         descriptors = self.data[0].split('\n', 1)[1].split(' - ')
-        types_patterns = {
-            Line: re.compile(
-                r'^(\d{2})(\d{2})(\d{2})([NS]) '
-                r'(\d{3})(\d{2})(\d{2})([EW])$'
-            ),
-            Arc: re.compile(
-                r'^(\d{2})(\d{2})(\d{2})([NS]) '
-                r'(\d{3})(\d{2})(\d{2})([EW]) '
-                r'thence (clockwise|anti-clockwise) '
-                r'.+arc.+ (\d+(?:\.\d+)?) NM '
-                r'centred on '
-                r'(\d{2})(\d{2})(\d{2})([NS]) '
-                r'(\d{3})(\d{2})(\d{2})([EW]) to '
-                r'(\d{2})(\d{2})(\d{2})([NS]) '
-                r'(\d{3})(\d{2})(\d{2})([EW])$'
-            ),
-            Parallel: re.compile(
-                r'^(\d{2})(\d{2})(\d{2})([NS]) '
-                r'(\d{3})(\d{2})(\d{2})([EW])'
-                r'.+line of latitude.+$'
-            )
-        }
-
-        return [geog for geog in (
-            next((
-                geog(i, match, self)
-                for i, (geog, match) in enumerate((t, p.search(d))
-                for t, p in types_patterns.items()
-                if p.search(d))
-            ), None)
-            for d in descriptors
-        ) if geog is not None]
+
+        lines = []
+        for descriptor in descriptors:
+            for geog_type, pattern in _LATERAL_PATTERNS:
+                match = pattern.search(descriptor)
+                if match is not None:
+                    lines.append(geog_type(len(lines), match, self))
+                    break
+        return lines
+
+    @cached_property
+    def _lateral_starts(self) -> typing.List[typing.Tuple[float, float]]:
+        """
+        Start coordinates of every lateral line, built in one pass so
+        that each Line.end is a plain list lookup rather than a walk
+        through its neighbour's cached properties.
+        """
+        return [line.start for line in self.lateral_lines]
 
     @cached_property
     def vertical(self) -> typing.Tuple[typing.Union[Altitude,Level]]:
@@ -122,7 +147,7 @@ class Airspace:
         An Altitude (FT) or Level (Flight-Level) object 
         representing the vertical upper airspace limit. 
         """
-        limit = re.search(r'Upper limit: (.+)', self.data[1])[1]
+        limit = _RE_UPPER_LIMIT.search(self.data[1])[1]
         return self.__vertical_matcher(limit)
 
     @cached_property
@@ -131,21 +156,15 @@ class Airspace:
         An Altitude (FT) or Level (Flight-Level) object 
         representing the lower upper airspace limit. 
         """
-        limit = re.search(r'Lower limit: (.+)', self.data[1])[1]
+        limit = _RE_LOWER_LIMIT.search(self.data[1])[1]
         return self.__vertical_matcher(limit)
 
     def __vertical_matcher(self, data: str) -> typing.Union[Altitude,Level]:
-        types_patterns = {
-            Altitude: re.compile(r'^(\d+) FT (ALT|AGL)$'),
-            Level: re.compile(r'^(?:(SFC|FL)(\d+)?)$')
-        }
-
-        return next((
-            t(match, self)
-            for t, match in ((t, p.search(data))
-            for t, p in types_patterns.items()
-            if p.search(data))
-        ), None)
+        for vertical_type, pattern in _VERTICAL_PATTERNS:
+            match = pattern.search(data)
+            if match is not None:
+                return vertical_type(match, self)
+        return None
 
     @cached_property
     def class_(self) -> str:
@@ -173,7 +192,7 @@ class Airspace:
         """
         The transition altitude in feet.
         """
-        altitude = re.findall(r'(\d+) FT', self.data[4])
+        altitude = _RE_TRANSITION_ALT.findall(self.data[4])
         return int(altitude[0]) if altitude else None
 
     @cached_property
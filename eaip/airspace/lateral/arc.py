@@ -1,7 +1,7 @@
 import typing
 from functools import cached_property
 from enum import Enum
-from geopy.point import Point
+from eaip.airspace._geo import dms_to_decimal
 from eaip.airspace.lateral.line import Line
 
 class Direction(Enum):
@@ -42,8 +42,8 @@ class Arc(Line):
         """
         (lat_deg, lat_min, lat_sec, lat_dir) = self.data.groups()[10:14]
         (long_deg, long_min, long_sec, long_dir) = self.data.groups()[14:18]
-        lat = Point.parse_degrees(lat_deg, lat_min, lat_sec, direction=lat_dir)
-        long = Point.parse_degrees(long_deg, long_min, long_sec, direction=long_dir)
+        lat = dms_to_decimal(lat_deg, lat_min, lat_sec, lat_dir)
+        long = dms_to_decimal(long_deg, long_min, long_sec, long_dir)
         return lat, long
 
     def __repr__(self):
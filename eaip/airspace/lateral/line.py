@@ -1,7 +1,6 @@
 import typing
 from functools import cached_property
-from geopy.point import Point
-
+from eaip.airspace._geo import dms_to_decimal
 from eaip.airspace.geog import Geog
 
 class Line(Geog):
@@ -23,16 +22,20 @@ class Line(Geog):
         """
         (lat_deg, lat_min, lat_sec, lat_dir) = self.data.groups()[0:4]
         (long_deg, long_min, long_sec, long_dir) = self.data.groups()[4:8]
-        lat = Point.parse_degrees(lat_deg, lat_min, lat_sec, direction=lat_dir)
-        long = Point.parse_degrees(long_deg, long_min, long_sec, direction=long_dir)
+        lat = dms_to_decimal(lat_deg, lat_min, lat_sec, lat_dir)
+        long = dms_to_decimal(long_deg, long_min, long_sec, long_dir)
         return lat, long
 
     @cached_property
     def end(self) -> typing.Tuple[float, float]:
         """
         Latitude and longitude of end point in decimal.
+
+        The final line wraps around to the first point, closing the
+        lateral boundary.
         """
-        return self.airspace.lateral_lines[self.index + 1].start
+        starts = self.airspace._lateral_starts
+        return starts[(self.index + 1) % len(starts)]
 
     def __repr__(self):
         return f'Line(start={self.start}, end={self.end})'
@@ -1,53 +1,79 @@
 import datetime
+import functools
 import re
 import typing
 from dataclasses import dataclass
 
+import numpy
+
+_DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun', 'PH')
+_DAY_INDEX = {day: index for index, day in enumerate(_DAYS)}
+
+_DAY_SPLIT_RE = re.compile(r', | and | & ')
+
+_H24_RE = re.compile(r'\bH24\b')
+_DAYLIGHT_RE = re.compile(r'\bDaylight\b')
+
+_OP_HOURS_RE = re.compile(
+    r'(?P<h24>H24)|(?P<daylight>Daylight).+|(?P<summer>Summer)|(?P<winter>Winter)|'
+    r'(?P<days>(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun|PH)'
+    r'(?:-|, | & | and )?)+)|(?P<start>\d{4}|SS)-(?P<end>\d{4}|SS)|(?P<open>\()|(?P<close>\))'
+)
+
 
 @dataclass
 class OperatingWeek:
 
-    monday: typing.Tuple[typing.List[datetime.time]]
+    __slots__ = ('monday', 'tuesday', 'wednesday', 'thursday',
+                 'friday', 'saturday', 'sunday', 'holiday')
+
+    monday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Monday.
     """
 
-    tuesday: typing.Tuple[typing.List[datetime.time]]
+    tuesday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Tuesday.
     """
 
-    wednesday: typing.Tuple[typing.List[datetime.time]]
+    wednesday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Wednesday.
     """
 
-    thursday: typing.Tuple[typing.List[datetime.time]]
+    thursday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Thursday.
     """
 
-    friday: typing.Tuple[typing.List[datetime.time]]
+    friday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Friday.
     """
 
-    saturday: typing.Tuple[typing.List[datetime.time]]
+    saturday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Friday.
     """
 
-    sunday: typing.Tuple[typing.List[datetime.time]]
+    sunday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on Sunday.
     """
 
-    holiday: typing.Tuple[typing.List[datetime.time]]
+    holiday: typing.Tuple[datetime.time, datetime.time]
     """
     Opening hours on public holidays.
     """
 
 
+_H24_DAY = (datetime.time.min, datetime.time.max)
+_H24_WEEK = OperatingWeek(*([_H24_DAY] * 8))
+_H24_STARTS = numpy.zeros(16, dtype=numpy.int16)
+_H24_ENDS = numpy.full(16, 1440, dtype=numpy.int16)
+
+
 class OperatingHours:
     """
     Object that represents the opening hours of an
@@ -55,6 +81,8 @@ class OperatingHours:
     of object.
     """
 
+    __slots__ = ('hours', 'summer', 'is_24_hr', 'is_daylight', '_starts', '_ends')
+
     hours: OperatingWeek
     """
     Regular operating hours.
@@ -78,17 +106,51 @@ class OperatingHours:
     def __init__(self, *hours: typing.Tuple[datetime.time, datetime.time],
                  is_24_hr: bool = False, is_daylight: bool = False):
         if is_24_hr:
-            hours = [(datetime.time.min, datetime.time.max)]*16
+            # Both weeks are the same immutable constant; sharing them
+            # skips rebuilding identical objects per 24-hr airfield.
+            self.hours = _H24_WEEK
+            self.summer = _H24_WEEK
+            self.is_24_hr = True
+            self.is_daylight = is_daylight
+            self._starts = _H24_STARTS
+            self._ends = _H24_ENDS
+            return
 
         self.hours = OperatingWeek(*hours[:8])
         self.summer = OperatingWeek(*hours[8:16])
         self.is_24_hr = is_24_hr
         self.is_daylight = is_daylight
 
+        # Flat minutes-since-midnight layout (regular week then summer
+        # week, one row per day, -1 where no hours apply) so open
+        # checks can be vectorized across all days at once.
+        starts = numpy.full(16, -1, dtype=numpy.int16)
+        ends = numpy.full(16, -1, dtype=numpy.int16)
+        for index, day_hours in enumerate(hours[:16]):
+            if day_hours:
+                start, end = day_hours
+                starts[index] = start.hour * 60 + start.minute
+                ends[index] = end.hour * 60 + end.minute + (1 if end.second else 0)
+        self._starts = starts
+        self._ends = ends
+
+    def open_at(self, at: datetime.time, summer: bool = False) -> numpy.ndarray:
+        """
+        Vectorized open check for a given wall-clock time.
+
+        :param at: The time of day to check.
+        :param summer: Check the summer week instead of the regular one.
+        :return: Boolean array over the eight days (Mon..Sun, PH).
+        """
+        minutes = at.hour * 60 + at.minute
+        week = slice(8, 16) if summer else slice(0, 8)
+        return (self._starts[week] <= minutes) & (minutes < self._ends[week])
+
     def __repr__(self):
         return f'OperatingHours(is_24_hr={self.is_24_hr}, is_daylight={self.is_daylight})'
 
 
+@functools.lru_cache(maxsize=4096)
 def get_operating_hours_from_string(string_to_convert: str) -> OperatingHours:
     """
     Converts a string representing operational hours or opening hours
@@ -98,19 +160,19 @@ def get_operating_hours_from_string(string_to_convert: str) -> OperatingHours:
     :param string_to_convert: The string to decode.
     :return: The :py:meth:`eaip.hours.OperatingHours` object which represents the string.
     """
-    opening_hours_raw = re.findall(
-        r'(H24)|(Daylight).+|(Summer)|(Winter)|'
-        r'(?:((?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun|PH)'
-        r'(?:-|, | & | and )?)+))|(\d{4}|SS)-(\d{4}|SS)|(\()|(\))',
-        string_to_convert
-    )
+    tokens = list(_OP_HOURS_RE.finditer(string_to_convert))
 
-    opening_hours_raw = [data for sublist in opening_hours_raw for data in sublist]
+    if tokens:
+        # Only trust a whole-string H24/Daylight match when no actual
+        # schedule was parsed; embedded mentions (e.g. remarks after a
+        # per-day listing) must not discard the parsed hours.
+        kinds = {token.lastgroup for token in tokens}
+        has_schedule = 'days' in kinds or 'end' in kinds
 
-    if len(opening_hours_raw) >= 2:
-        is_24_hr, is_daylight = opening_hours_raw[:2]
-        is_24_hr = is_24_hr == 'H24'
-        is_daylight = is_daylight == 'Daylight'
+        is_24_hr = tokens[0].lastgroup == 'h24' or \
+            (not has_schedule and _H24_RE.search(string_to_convert) is not None)
+        is_daylight = tokens[0].lastgroup == 'daylight' or \
+            (not has_schedule and _DAYLIGHT_RE.search(string_to_convert) is not None)
 
         hours = [None] * 8
         summer_hours = [None] * 8
@@ -118,36 +180,43 @@ def get_operating_hours_from_string(string_to_convert: str) -> OperatingHours:
         is_summer = False
 
         day_range = (0, 7)
-        current_hours = [None, None]
-        for identifier in opening_hours_raw[2:]:
-            if identifier:
-                days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun', 'PH']
-
-                day_list_raw = re.split(r', | and | & ', identifier)
-                day_range_list = []
-
-                for day_item_raw in day_list_raw:
+        start_time = None
+        for token in tokens:
+            kind = token.lastgroup
+
+            if kind in ('summer', 'open'):
+                is_summer = True
+            elif kind in ('winter', 'close'):
+                is_summer = False
+            elif kind == 'days':
+                identifier = token['days']
+
+                # Most entries are a single day; skip the splitter.
+                if identifier in _DAY_INDEX:
+                    index = _DAY_INDEX[identifier]
+                    day_range = (index, index)
+                    continue
+
+                for day_item_raw in _DAY_SPLIT_RE.split(identifier):
                     day_range_raw = day_item_raw.split('-')
                     if len(day_range_raw) > 1:
-                        day_range = (days.index(day_range_raw[0]), days.index(day_range_raw[1]))
-
-                    if day_item_raw in days:
-                        day_range = (days.index(day_item_raw), days.index(day_item_raw))
-
-                    day_range_list.append(day_range)
-
-                is_summer = True if identifier in ['(', 'Summer'] else \
-                    False if identifier in [')', 'Winter'] else is_summer
-
-                if identifier.isdigit() and int(identifier) < 2400:
-                    current_hours[current_hours.index(None)] = datetime.datetime.strptime(identifier, '%H%M').time()
-
-                if all(current_hours):
-                    day_range = day_range_list.pop(0)
-                    for day in range(day_range[0], day_range[1] + 1):
-                        (summer_hours if is_summer else hours)[day] = current_hours
-
-                    current_hours = [None, None]
+                        day_range = (_DAY_INDEX[day_range_raw[0]], _DAY_INDEX[day_range_raw[1]])
+
+                    if day_item_raw in _DAY_INDEX:
+                        day_range = (_DAY_INDEX[day_item_raw], _DAY_INDEX[day_item_raw])
+            elif kind == 'end':
+                for identifier in (token['start'], token['end']):
+                    if identifier.isdigit() and int(identifier) < 2400:
+                        parsed_time = datetime.time(int(identifier[:2]), int(identifier[2:]))
+                        if start_time is None:
+                            start_time = parsed_time
+                        else:
+                            current_hours = (start_time, parsed_time)
+                            target = summer_hours if is_summer else hours
+                            target[day_range[0]:day_range[1] + 1] = \
+                                [current_hours] * (day_range[1] - day_range[0] + 1)
+
+                            start_time = None
 
         return OperatingHours(
             *hours, *summer_hours,
@@ -5,6 +5,9 @@ from functools import cached_property
 import eaip
 from eaip.hours import OperatingHours, get_operating_hours_from_string
 
+_FREQ_RE = re.compile(r'(\d{3}\.\d{3}) MHz')
+_FREQ_DESC_RE = re.compile(r'\d{3}\.\d{3} MHz(?:\n(.+))?')
+
 
 class RadioFrequency:
     """
@@ -28,36 +31,28 @@ class RadioFrequency:
         """
         Service offered by radio facility.
         """
-        designation = None
-        for row in self.airfield.data['2.18']['data'][2:]:
-            designation = row[0] if row[0] else designation
-            if row == self.data:
-                return designation
+        return self.airfield._radio_labels[id(self.data)][0]
 
     @cached_property
     def callsign(self) -> str:
         """
         Radio callsign.
         """
-        designation = None
-        for row in self.airfield.data['2.18']['data'][2:]:
-            designation = row[1] if row[1] else designation
-            if row == self.data:
-                return designation
+        return self.airfield._radio_labels[id(self.data)][1]
 
     @cached_property
     def frequency(self) -> float:
         """
         Frequency of radio service in MHz.
         """
-        return float(re.search(r'(\d{3}\.\d{3}) MHz', self.data[2]).group(1))
+        return float(_FREQ_RE.search(self.data[2]).group(1))
 
     @cached_property
     def frequency_description(self) -> str:
         """
         Frequency description.
         """
-        return re.search(r'\d{3}\.\d{3} MHz(?:\n(.+))?', self.data[2]).group(1)
+        return _FREQ_DESC_RE.search(self.data[2]).group(1)
 
     @cached_property
     def operating_hours(self) -> typing.Union[None, OperatingHours]:
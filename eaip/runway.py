@@ -2,9 +2,16 @@ import re
 import typing
 from functools import cached_property
 
-from geopy.point import Point
-
 import eaip
+from eaip.airspace._geo import dms_to_decimal
+
+_DIM_RE = re.compile(r'(\d+)\s+x\s+(\d+)\s+M')
+_SURFACE_RE = re.compile(r'RWY surface: (.+)')
+_GEOG_RE = re.compile(r'(\d{2})(\d{2})(\d{2}\.\d+)([NS]) (\d{3})(\d{2})(\d{2}\.\d+)([EW])')
+_THR_RE = re.compile(r'THR (\d+) FT')
+_DIST_RE = re.compile(r'(\d+) M')
+
+_DISTANCE_SHORTS = ('TORA', 'TODA', 'ASDA', 'LDA')
 
 
 class Runway:
@@ -43,39 +50,51 @@ class Runway:
         The true heading. `None` if not available.
         """
         bearing = self.data[1]
-        return float(bearing.replace('°', '')) if bearing else None
+        return float(bearing.rstrip('°')) if bearing else None
+
+    @cached_property
+    def _parsed(self) -> dict:
+        """
+        Results of the per-cell regexes, fired together in one pass
+        since these properties are typically read as a group.
+        """
+        dimensions = _DIM_RE.search(self.data[2].replace('-', '0'))
+        surface_type = _SURFACE_RE.search(self.data[3])
+        geog = _GEOG_RE.search(self.data[4])
+        elevation = _THR_RE.search(self.data[5])
+        return {
+            'dimensions': dimensions.groups() if dimensions else (0, 0),
+            'surface_type': surface_type.group(1) if surface_type else None,
+            'geog': geog.groups() if geog else None,
+            'elevation': int(elevation.group(1)) if elevation else None
+        }
 
     @cached_property
     def dimensions(self) -> typing.Tuple[int, int]:
         """
         Dimensions of runway in metres. 0x0m if not available.
         """
-        dimensions = self.data[2]
-        dimensions = re.findall(r'(\d+)\s+x\s+(\d+)\s+M', dimensions.replace('-', '0'))
-        return dimensions[0] if dimensions else (0, 0)
+        return self._parsed['dimensions']
 
     @cached_property
     def surface_type(self) -> typing.Union[None, str]:
         """
         Description of runway surface type. `None` if not available.
         """
-        surface_type = self.data[3]
-        surface_type = re.findall(r'RWY surface: (.+)', surface_type)
-        return surface_type[0] if surface_type else None
+        return self._parsed['surface_type']
 
     @cached_property
     def geog(self) -> typing.Union[None, typing.Tuple[float, float]]:
         """
         Latitude and longitude of runway in decimal. `None` if not available.
         """
-        geog = self.data[4]
-        geog = re.findall(r'(\d{2})(\d{2})(\d{2}\.\d+)([NS]) (\d{3})(\d{2})(\d{2}\.\d+)([EW])', geog)
+        geog = self._parsed['geog']
 
         if geog:
-            lat_deg, lat_min, lat_sec, lat_dir, long_deg, long_min, long_sec, long_dir = geog[0]
+            lat_deg, lat_min, lat_sec, lat_dir, long_deg, long_min, long_sec, long_dir = geog
 
-            lat = Point.parse_degrees(lat_deg, lat_min, lat_sec, direction=lat_dir)
-            long = Point.parse_degrees(long_deg, long_min, long_sec, direction=long_dir)
+            lat = dms_to_decimal(lat_deg, lat_min, lat_sec, lat_dir)
+            long = dms_to_decimal(long_deg, long_min, long_sec, long_dir)
             return lat, long
         return None
 
@@ -84,9 +103,7 @@ class Runway:
         """
         The threshold elevation of the runway in feet. ``None`` if not available.
         """
-        elevation = self.data[5]
-        elevation = re.findall(r'THR (\d+) FT', elevation)
-        return int(elevation[0]) if elevation else None
+        return self._parsed['elevation']
 
     @cached_property
     def papi(self) -> typing.Union[None, str]:
@@ -95,11 +112,24 @@ class Runway:
 
         TODO: Perhaps return an object that contains more information about the lighting?
         """
-        if self.airfield.data['2.14']['data']:
-            for row in self.airfield.data['2.14']['data'][2:]:
-                if row[0] == self.designation:
-                    return row[3].partition('\n')[0] or None
-        return None
+        return self.airfield._papi_by_designation.get(self.designation)
+
+    @cached_property
+    def _distances_by_type(self) -> typing.Dict[str, typing.List[int]]:
+        """
+        Declared distances keyed by type, built from a single pass over
+        the section 2.13 table.
+        """
+        by_type = {short: [] for short in _DISTANCE_SHORTS}
+        for row in self.airfield.data['2.13']['data'][2:]:
+            if row[0] == self.designation:
+                for distance_col, short in enumerate(_DISTANCE_SHORTS, start=1):
+                    distance = _DIST_RE.search(row[distance_col])
+                    if distance is not None:
+                        by_type[short].append(int(distance.group(1)))
+        for distances in by_type.values():
+            distances.sort(reverse=True)
+        return by_type
 
     def distances(self, distance_short: str = 'TORA') -> typing.Union[None, typing.List[int]]:
         """
@@ -112,14 +142,7 @@ class Runway:
         :param distance_short: Type of distance to find.
         :return: The list of distances in metres.
         """
-        distance_shorts = ['TORA', 'TODA', 'ASDA', 'LDA']
-        distance_col = distance_shorts.index(distance_short) + 1
-        distances = [re.search(r'(\d+) M', row[distance_col])
-                     for row in self.airfield.data['2.13']['data'][2:]
-                     if row[0] == self.designation]
-        distances = [int(distance.group(1)) for distance in distances if distance is not None]
-        distances.sort(reverse=True)
-        return distances or None
+        return self._distances_by_type[distance_short] or None
 
     @cached_property
     def tora(self) -> typing.Union[None, typing.List[int]]:
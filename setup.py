@@ -1,15 +1,6 @@
 #!/usr/bin/env python
 
 
-from distutils.core import setup
+from setuptools import setup
 
-setup(
-    name='eaip-lib',
-    version='0.0.1',
-    description='NATS eAIP Python API',
-    author='propellor-app',
-    author_email='',
-    url='https://github.com/propellor-app/eaip-lib',
-    packages=['eaip'],
-    license='MIT'
-)
+setup()
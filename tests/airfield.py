@@ -1,13 +1,46 @@
-import unittest
 import asyncio
+import os
+import unittest
+
+import msgpack
+
 import eaip
+from eaip.airfield import Airfield
+
+CACHE_DIRECTORY = os.path.join(os.path.dirname(__file__), '.cache')
+
+
+def _load_or_fetch(airfield_icao):
+    """
+    Returns the airfield, fetching it over the network only on the
+    first run and memoizing the result to disk for runs thereafter.
+    """
+    cache_url = os.path.join(CACHE_DIRECTORY, f'{airfield_icao}.bin')
+    if os.path.exists(cache_url):
+        with open(cache_url, 'rb') as cache:
+            return Airfield(cache.read())
+
+    async def fetch():
+        try:
+            return await eaip.get_airfield(airfield_icao, bypass_cache=True)
+        finally:
+            await eaip.close_session()
+
+    airfield = asyncio.run(fetch())
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    with open(cache_url, 'wb') as cache:
+        cache.write(msgpack.packb(airfield.data, use_bin_type=True))
+    return airfield
 
 
 class TestAirfield(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.airfield = _load_or_fetch('EGKR')
+
     def test_airfield_icao(self):
-        a = asyncio.run(eaip.get_airfield('EGKR'))
-        self.assertEqual(a.icao, 'EGKR')
+        self.assertEqual(self.airfield.icao, 'EGKR')
 
 
 if __name__ == '__main__':